@@ -0,0 +1,171 @@
+import gc
+import hashlib
+import json
+import platform
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from charts import build_charts, build_subplot, warmup_renderer
+from config import BenchmarkConfig
+from helpers import (
+    AdapterCutter, FastQFileReader, FastQFileWriter, FastQGenerator, FastQRecordCollection, QualityScoreHelper,
+)
+from profiler import StageProfiler, ProgressLine
+from utils import show_to_user
+
+
+STATISTICS: dict[str, Callable[[FastQRecordCollection], Any]] = {
+    "get_seq_len_moda": lambda records: records.get_seq_len_moda(),
+    "get_agv_cg_composition": lambda records: records.get_agv_cg_composition(),
+    "get_avg_nucleotide_composition": lambda records: records.get_avg_nucleotide_composition(),
+    "get_cuts_count": lambda records: records.get_cuts_count(),
+    "get_cut_records_count": lambda records: records.get_cut_records_count(),
+    "get_distinct_len": lambda records: records.get_distinct_len(full_range=True),
+    "get_distinct_gc_percentages": lambda records: records.get_distinct_gc_percentages(),
+    "get_sequence_content_across_all_bases": lambda records: records.get_sequence_content_across_all_bases(),
+    "average_quality_per_read": lambda records: records.average_quality_per_read(),
+    "quality_scores_across_all_bases": lambda records: records.quality_scores_across_all_bases(),
+}
+
+
+def measure(profiler: StageProfiler, stage: str, records_count: int | None, func: Callable, *args, **kwargs):
+    gc.collect()
+    result = profiler.measure(stage, func, *args, records=records_count, **kwargs)
+    show_stage(profiler, stage)
+    return result
+
+
+def show_stage(profiler: StageProfiler, stage: str):
+    show_to_user(f"  {stage}: {profiler.stages[stage]['wall_time']:.3f} с")
+
+
+def get_synthetic_file(config: BenchmarkConfig, count: int) -> Path:
+    params = {**config.generator_params, "quality_type": config.quality_type}
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:10]
+    path = config.work_dir / f"synthetic-{count}-{digest}.fastq"
+    if path.exists():
+        return path
+
+    show_to_user(f"Генерация {count} записей в {path.name}")
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f_out:
+        FastQFileWriter(f_out, QualityScoreHelper(config.quality_type)).write(
+            FastQGenerator(count, **config.generator_params)
+        )
+    tmp_path.rename(path)
+    return path
+
+
+def bench(config: BenchmarkConfig, count: int) -> dict:
+    datafile = get_synthetic_file(config, count)
+    show_to_user(f"\nЗамер на {count} записях")
+    profiler = StageProfiler()
+    quality_helper = QualityScoreHelper(config.quality_type)
+
+    # чтение замеряется так же, как в run.process: с обновлением строки прогресса
+    file_size = datafile.stat().st_size
+    gc.collect()
+    with open(datafile) as f, profiler.stage("parse", records=count, bytes_count=file_size):
+        reader = FastQFileReader(stream=f, quality_helper=quality_helper)
+        progress = ProgressLine("  Чтение файла", file_size)
+        records = reader.get_all_records(on_progress=progress.update)
+        progress.finish()
+    show_stage(profiler, "parse")
+
+    records = measure(
+        profiler, "cut", count, records.cut,
+        adapter_cutter=AdapterCutter(
+            start_adapter=config.adapter,
+            end_adapter=config.adapter,
+            min_len=config.adapter_min_length,
+        ),
+    )
+
+    # AdapterCutter может обрезать запись целиком, а статистики не рассчитаны на пустые записи,
+    # поэтому такие записи отбрасываются вне замеров
+    empty_after_cut = sum(not rec.seq for rec in records)
+    if empty_after_cut:
+        records = FastQRecordCollection([rec for rec in records if rec.seq])
+        show_to_user(f"  Пустых записей после обрезки: {empty_after_cut}")
+
+    results = {
+        name: measure(profiler, name, records.count, statistic, records)
+        for name, statistic in STATISTICS.items()
+    }
+
+    write_path = config.work_dir / "benchmark-write.fastq"
+    gc.collect()
+    with open(write_path, "w", encoding="utf-8") as f_out, profiler.stage("write", records=records.count) as stage:
+        FastQFileWriter(f_out, quality_helper).write(records.records)
+        stage["bytes"] = f_out.tell()
+    show_stage(profiler, "write")
+    write_path.unlink()
+
+    charts = measure(
+        profiler, "build_charts", None, build_charts,
+        distinct_len=results["get_distinct_len"],
+        distinct_gc=results["get_distinct_gc_percentages"],
+        content_across_bases=results["get_sequence_content_across_all_bases"],
+        avg_quality_per_read=results["average_quality_per_read"],
+        quality_across_bases=results["quality_scores_across_all_bases"],
+    )
+    charts = {f"chart{i}": chart for i, chart in enumerate(charts, start=1)}
+    charts["subplot"] = build_subplot(list(charts.values()))
+    measure(profiler, "init_chart_renderer", None, warmup_renderer, config.charts_quality)
+    for name, chart in charts.items():
+        chart_path = config.work_dir / f"benchmark-{name}.png"
+        measure(profiler, f"save_{name}", None, chart.save, chart_path, ppi=config.charts_quality)
+        chart_path.unlink()
+
+    return {
+        "reads": count,
+        "file_size": datafile.stat().st_size,
+        "empty_after_cut": empty_after_cut,
+        "stages": profiler.report()["stages"],
+    }
+
+
+def compare(previous: dict, current: dict):
+    previous_runs = {run["reads"]: run["stages"] for run in previous["runs"]}
+    for run in current["runs"]:
+        if run["reads"] not in previous_runs:
+            continue
+        show_to_user(f"\nСравнение на {run['reads']} записях (было -> стало)")
+        for stage, values in run["stages"].items():
+            old = previous_runs[run["reads"]].get(stage)
+            if old is None or "wall_time" not in old:
+                continue
+            old_time = old["wall_time"]
+            ratio = old_time / values["wall_time"] if values["wall_time"] else float("inf")
+            show_to_user(f"  {stage}: {old_time:.3f} с -> {values['wall_time']:.3f} с (x{ratio:.2f})")
+
+
+def run(config: BenchmarkConfig):
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            **config.generator_params,
+            "quality_type": config.quality_type,
+            "charts_quality": config.charts_quality,
+        },
+        "runs": [],
+    }
+    # отчет перезаписывается после каждого замера, чтобы при нехватке памяти на больших файлах
+    # не потерять уже полученные результаты
+    report_path = config.output_dir / f"{datetime.now().timestamp()}.json"
+    show_to_user(f"Результаты сохраняются в:\n{report_path.absolute().as_uri()}")
+    for count in config.reads:
+        report["runs"].append(bench(config, count))
+        report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+        gc.collect()
+
+    if config.compare is not None:
+        compare(json.loads(config.compare.read_text()), report)
+
+
+if __name__ == "__main__":
+    run(BenchmarkConfig(sys.argv[1:]))
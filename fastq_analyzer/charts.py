@@ -0,0 +1,109 @@
+from io import BytesIO
+from typing import Iterable, Mapping
+
+import altair as alt
+import pandas as pd
+
+
+def build_charts(
+        distinct_len: Iterable[tuple[int, int]],
+        distinct_gc: Iterable[tuple[int, int]],
+        content_across_bases: Mapping[str, Iterable[float]],
+        avg_quality_per_read: Iterable[tuple[float, int]],
+        quality_across_bases: Iterable[tuple[int, float]],
+) -> list[alt.Chart]:
+    first_chart = (
+        alt
+        .Chart(pd.DataFrame(
+            distinct_len,
+            columns=["x", "y"]
+        ))
+        .mark_bar(size=5)
+        .encode(
+            x=alt.X("x:Q", title="Sequence length"),
+            y=alt.Y("y:Q", title="Number of sequences"),
+        ).properties(
+            title="Sequence length distribution",
+            width=400, height=300,
+        )
+    )
+
+    second_chart = (
+        alt
+        .Chart(pd.DataFrame(
+            distinct_gc,
+            columns=["x", "y"]
+        ))
+        .mark_bar(size=3)
+        .encode(
+            x=alt.X("x:Q", title="GC - composition (%)").axis(values=list(range(0, 101, 10))),
+            y=alt.Y("y:Q", title="Number of sequences"),
+        ).properties(
+            title="GC - composition distribution",
+            width=400, height=300,
+        )
+    )
+
+    third_chart_df = pd.DataFrame(content_across_bases)\
+        .melt("x", var_name="Line", value_name="Values")
+    third_chart = (
+        alt
+        .Chart(third_chart_df)
+        .mark_line(interpolate="linear")
+        .encode(
+            x=alt.X("x:Q", title="Position in read").axis(),
+            y=alt.Y("Values:Q", title="Nucleotide (%)",
+                    scale=alt.Scale(domainMax=third_chart_df["Values"].max() + 3)),
+            color=alt.Color("Line:N", sort=("A", "T", "G", "C", "N")),
+        ).properties(
+            title="Sequence content across all bases",
+            width=400, height=300,
+        )
+    )
+
+    fourth_chart = (
+        alt
+        .Chart(pd.DataFrame(
+            avg_quality_per_read,
+            columns=["x", "y"]
+        ))
+        .mark_bar(size=3)
+        .encode(
+            x=alt.X("x:Q", title="Mean sequence quality (phred score)").axis(),
+            y=alt.Y("y:Q", title="Number of sequences"),
+        ).properties(
+            title="Average quality per read",
+            width=400, height=300,
+        )
+    )
+
+    fives_chart_df = pd.DataFrame(quality_across_bases, columns=["x", "y"])
+    fives_chart = (
+        alt
+        .Chart(fives_chart_df)
+        .mark_line()
+        .encode(
+            x=alt.X("x:Q", title="Position in read"),
+            y=alt.Y("y:Q", title="Quality score",
+                    scale=alt.Scale(domain=[fives_chart_df["y"].min() - 1, fives_chart_df["y"].max() + 1])),
+        ).properties(
+            title="Quality scores across all bases",
+            width=400, height=300,
+        )
+    )
+
+    return [first_chart, second_chart, third_chart, fourth_chart, fives_chart]
+
+
+def build_subplot(charts: list[alt.Chart]) -> alt.VConcatChart:
+    first_chart, second_chart, third_chart, fourth_chart, fives_chart = charts
+    return alt.vconcat(
+        alt.hconcat(first_chart, second_chart, third_chart),
+        alt.hconcat(fourth_chart, fives_chart),
+    )
+
+
+def warmup_renderer(ppi: int):
+    # первое сохранение в png инициализирует движок рендеринга и занимает заметно дольше остальных
+    chart = alt.Chart(pd.DataFrame({"x": [0]})).mark_point().encode(x="x:Q")
+    chart.save(BytesIO(), format="png", ppi=ppi)
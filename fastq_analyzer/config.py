@@ -21,6 +21,9 @@ class Config:
     charts_quality: int
     subplot: bool
 
+    profile: bool
+    cprofile: bool
+
     def __init__(self, args: list[str]):
         self.parser = ArgumentParser()
         self.add_args()
@@ -96,6 +99,15 @@ class Config:
             help="Объединить графики на одно полотно"
         )
 
+        self.parser.add_argument(
+            "--profile", action="store_true",
+            help="Вывести время каждого этапа и сохранить отчет profile.json в папку с выводными данными"
+        )
+        self.parser.add_argument(
+            "--cprofile", action="store_true",
+            help="Дополнительно запустить обработку под cProfile и сохранить profile.pstats. Включает --profile"
+        )
+
     def parse(self, args: list[str]):
         args = self.parser.parse_args(args)
         self._data_dir = args.data_dir
@@ -132,6 +144,9 @@ class Config:
             self.charts_quality = args.charts_quality
         self.subplot = args.subplot
 
+        self.cprofile = args.cprofile
+        self.profile = args.profile or args.cprofile
+
     def get_file_content(self, path: Path) -> str | None:
         res_path = self._data_dir / path
         if not res_path.exists():
@@ -163,3 +178,163 @@ class Config:
                 path.mkdir(parents=True)
             setattr(self, "_calc_output_dir", path)
         return getattr(self, "_calc_output_dir")
+
+
+class BenchmarkConfig:
+    reads: list[int]
+    _work_dir: Path
+    _output_dir: Path
+    compare: Path | None
+
+    length_mean: int
+    length_sd: float
+    min_length: int
+    max_length: int
+    adapter_rate: float
+    adapter: str
+    adapter_min_length: int
+    n_rate: float
+    quality_type: str
+    seed: int
+
+    charts_quality: int
+
+    def __init__(self, args: list[str]):
+        self.parser = ArgumentParser()
+        self.add_args()
+        self.parse(args)
+
+    def add_args(self):
+        self.parser.add_argument(
+            "--reads", "-r", type=int, nargs="+",
+            default=[10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7],
+            help="Количество записей в синтетических файлах, для каждого значения выполняется отдельный замер. "
+                 "Все записи хранятся в памяти: около 1.7 КБ на запись при чтении и еще больше при подсчете "
+                 "статистик, для 10^7 записей нужно более 24 ГБ ОЗУ",
+        )
+        self.parser.add_argument(
+            "--work-dir", type=Path,
+            default=Path(__file__).parent / "data" / "synthetic",
+            help="Папка для сгенерированных файлов. Уже сгенерированные файлы используются повторно",
+        )
+        self.parser.add_argument(
+            "--output-dir", type=Path,
+            default=Path(__file__).parent / "output" / "benchmarks",
+            help="Папка для JSON с результатами замеров",
+        )
+        self.parser.add_argument(
+            "--compare", type=Path,
+            default=None,
+            help="JSON с результатами предыдущего запуска для сравнения",
+        )
+
+        self.parser.add_argument(
+            "--length-mean", type=int, default=76,
+            help="Средняя длина последовательности",
+        )
+        self.parser.add_argument(
+            "--length-sd", type=float, default=0,
+            help="Стандартное отклонение длины последовательности. При 0 все записи одной длины",
+        )
+        self.parser.add_argument(
+            "--min-length", type=int, default=20,
+            help="Минимальная длина последовательности",
+        )
+        self.parser.add_argument(
+            "--max-length", type=int, default=150,
+            help="Максимальная длина последовательности",
+        )
+        self.parser.add_argument(
+            "--adapter-rate", type=float, default=0.1,
+            help="Доля записей с адаптером (отдельно для начала и конца записи)",
+        )
+        self.parser.add_argument(
+            "--adapter-seq", type=str,
+            default=(Path(__file__).parent / "test_data" / "adapter.txt").read_text().strip(),
+            help="Адаптерная последовательность",
+        )
+        self.parser.add_argument(
+            "--adapter-min-length", type=int, default=8,
+            help="Размер минимального вхождения адаптерной последовательности "
+                 "(для генерации адаптеров и их удаления)",
+        )
+        self.parser.add_argument(
+            "--n-rate", type=float, default=0.001,
+            help="Доля неопределенных нуклеотидов (N)",
+        )
+        self.parser.add_argument(
+            "--quality-type", "-sq", choices=["Phred+33", "Phred+64"],
+            default="Phred+33",
+            help="Формат записи качества секвенирования"
+        )
+        self.parser.add_argument(
+            "--seed", type=int, default=0,
+            help="Seed генератора случайных чисел",
+        )
+
+        self.parser.add_argument(
+            "--charts-quality", "-cq", type=int,
+            default=300,
+            help="Качество графиков в dpi",
+        )
+
+    def parse(self, args: list[str]):
+        args = self.parser.parse_args(args)
+        if any(count <= 0 for count in args.reads):
+            self.parser.error("Количество записей должно быть положительным числом")
+        self.reads = args.reads
+        self._work_dir = args.work_dir
+        self._output_dir = args.output_dir
+        self.compare = args.compare
+
+        if not 0 < args.min_length <= args.length_mean <= args.max_length:
+            self.parser.error("Должно выполняться 0 < --min-length <= --length-mean <= --max-length")
+        self.length_mean = args.length_mean
+        self.length_sd = args.length_sd
+        self.min_length = args.min_length
+        self.max_length = args.max_length
+
+        if not 0 <= args.adapter_rate <= 1 or not 0 <= args.n_rate <= 1:
+            self.parser.error("--adapter-rate и --n-rate должны быть в диапазоне от 0 до 1")
+        self.adapter_rate = args.adapter_rate
+        self.adapter = args.adapter_seq
+        if args.adapter_min_length < 3:
+            self.adapter_min_length = 3
+            show_to_user(
+                f"Минимальная длина адаптера 3. "
+                f"Установлено значение 3 вместо введенного {args.adapter_min_length}"
+            )
+        else:
+            self.adapter_min_length = args.adapter_min_length
+        self.n_rate = args.n_rate
+        self.quality_type = args.quality_type
+        self.seed = args.seed
+
+        self.charts_quality = args.charts_quality
+
+    @property
+    def generator_params(self) -> dict:
+        return {
+            "length_mean": self.length_mean,
+            "length_sd": self.length_sd,
+            "min_length": self.min_length,
+            "max_length": self.max_length,
+            "adapter_rate": self.adapter_rate,
+            "start_adapter": self.adapter,
+            "end_adapter": self.adapter,
+            "adapter_min_len": self.adapter_min_length,
+            "n_rate": self.n_rate,
+            "seed": self.seed,
+        }
+
+    @property
+    def work_dir(self) -> Path:
+        if not self._work_dir.exists():
+            self._work_dir.mkdir(parents=True)
+        return self._work_dir
+
+    @property
+    def output_dir(self) -> Path:
+        if not self._output_dir.exists():
+            self._output_dir.mkdir(parents=True)
+        return self._output_dir
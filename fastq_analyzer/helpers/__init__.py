@@ -2,3 +2,4 @@ from .fastq_file_reader import *
 from .fastq_file_writer import *
 from .quality_score_reader import *
 from .adapter_cutter import *
+from .fastq_generator import *
@@ -1,4 +1,4 @@
-from typing import Iterator, TextIO, TYPE_CHECKING, Literal, Self
+from typing import Callable, Iterator, TextIO, TYPE_CHECKING, Literal, Self
 
 if TYPE_CHECKING:
     from .quality_score_reader import QualityScoreHelper
@@ -9,6 +9,7 @@ __all__ = ["FastQFileReader", "FastQRecord", "FastQRecordCollection"]
 
 
 class FastQFileReader:
+    progress_step = 10000
 
     def __init__(
             self,
@@ -23,6 +24,12 @@ class FastQFileReader:
     def closed(self):
         return self.stream.closed
 
+    @property
+    def position(self) -> int:
+        # у текстового потока tell() медленный, поэтому берем позицию из буфера
+        stream = getattr(self.stream, "buffer", self.stream)
+        return stream.tell()
+
     def __iter__(self) -> Iterator["FastQRecord"]:
         return self
 
@@ -52,8 +59,16 @@ class FastQFileReader:
             return self._get_line()
         return line
 
-    def get_all_records(self) -> "FastQRecordCollection":
-        return FastQRecordCollection([record for record in self])
+    def get_all_records(self, on_progress: Callable[[int], None] | None = None) -> "FastQRecordCollection":
+        if on_progress is None:
+            return FastQRecordCollection([record for record in self])
+
+        records = []
+        for record in self:
+            records.append(record)
+            if len(records) % self.progress_step == 0:
+                on_progress(self.position)
+        return FastQRecordCollection(records)
 
 
 class FastQRecord:
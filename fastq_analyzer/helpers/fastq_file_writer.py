@@ -1,4 +1,4 @@
-from typing import Sequence, TextIO
+from typing import Iterable, TextIO
 
 from .quality_score_reader import QualityScoreHelper
 from .fastq_file_reader import FastQRecord
@@ -17,6 +17,6 @@ class FastQFileWriter:
         self.stream = stream
         self.quality_helper = quality_helper
 
-    def write(self, records: Sequence[FastQRecord]):
+    def write(self, records: Iterable[FastQRecord]):
         for record in records:
             self.stream.write(record.to_fastq(self.quality_helper))
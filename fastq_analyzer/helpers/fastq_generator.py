@@ -0,0 +1,104 @@
+import random
+from typing import Iterator
+
+from .fastq_file_reader import FastQRecord
+
+
+__all__ = ["FastQGenerator"]
+
+
+# Детерминированный генератор синтетических записей для бенчмарков.
+# Качество генерируется числами, смещение Phred задается при записи через QualityScoreHelper.
+class FastQGenerator:
+    nucleotides = ("A", "T", "G", "C")
+    n_quality = 2
+
+    def __init__(
+            self,
+            count: int,
+            length_mean: int = 76,
+            length_sd: float = 0,
+            min_length: int = 20,
+            max_length: int = 150,
+            adapter_rate: float = 0,
+            start_adapter: str = "",
+            end_adapter: str = "",
+            adapter_min_len: int = 3,
+            n_rate: float = 0,
+            min_quality: int = 20,
+            max_quality: int = 41,
+            seed: int = 0,
+    ):
+        assert count >= 0, "Read count must be non-negative"
+        assert 0 < min_length <= length_mean <= max_length, "Length bounds are inconsistent"
+        assert 0 <= adapter_rate <= 1, "Adapter rate must be in [0, 1]"
+        assert 0 <= n_rate <= 1, "N rate must be in [0, 1]"
+        assert self.n_quality <= min_quality <= max_quality, "Quality bounds are inconsistent"
+        self.count = count
+        self.length_mean = length_mean
+        self.length_sd = length_sd
+        self.min_length = min_length
+        self.max_length = max_length
+        self.adapter_rate = adapter_rate
+        self.start_adapter = start_adapter
+        self.end_adapter = end_adapter
+        self.adapter_min_len = adapter_min_len
+        self.n_rate = n_rate
+        self.min_quality = min_quality
+        self.max_quality = max_quality
+        self.seed = seed
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[FastQRecord]:
+        rng = random.Random(self.seed)
+        bases = self.nucleotides + ("N",)
+        weights = (*((1 - self.n_rate) / 4 for _ in self.nucleotides), self.n_rate)
+        qualities = range(self.min_quality, self.max_quality + 1)
+
+        for i in range(self.count):
+            length = self._get_length(rng)
+            seq = rng.choices(bases, weights=weights, k=length)
+            quality = [
+                self.n_quality if n == "N" else q
+                for n, q in zip(seq, rng.choices(qualities, k=length))
+            ]
+            seq = "".join(seq)
+            if self.start_adapter and rng.random() < self.adapter_rate:
+                seq = self._add_start_adapter(rng, seq)
+            if self.end_adapter and rng.random() < self.adapter_rate:
+                seq = self._add_end_adapter(rng, seq)
+
+            yield FastQRecord(
+                head=f"@SYNTHETIC:{self.seed}:{i + 1} 1:N:0:1",
+                seq=seq,
+                quality=tuple(quality),
+            )
+
+    def _get_length(self, rng: random.Random) -> int:
+        if not self.length_sd:
+            return self.length_mean
+        length = round(rng.gauss(self.length_mean, self.length_sd))
+        return min(max(length, self.min_length), self.max_length)
+
+    def _get_adapter_len(self, rng: random.Random, adapter: str, seq: str) -> int | None:
+        # адаптер занимает меньше половины чтения, чтобы после обрезки оставалась вставка
+        max_len = min(len(adapter), (len(seq) - 1) // 2)
+        if max_len < self.adapter_min_len:
+            return None
+        return rng.randint(self.adapter_min_len, max_len)
+
+    def _add_start_adapter(self, rng: random.Random, seq: str) -> str:
+        # в начале чтения оказывается хвост стартового адаптера
+        adapter_len = self._get_adapter_len(rng, self.start_adapter, seq)
+        if adapter_len is None:
+            return seq
+        return self.start_adapter[-adapter_len:] + seq[adapter_len:]
+
+    def _add_end_adapter(self, rng: random.Random, seq: str) -> str:
+        # в конце чтения оказывается начало концевого адаптера
+        adapter_len = self._get_adapter_len(rng, self.end_adapter, seq)
+        if adapter_len is None:
+            return seq
+        return seq[:-adapter_len] + self.end_adapter[:adapter_len]
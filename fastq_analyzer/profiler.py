@@ -0,0 +1,97 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from utils import show_to_user, show_progress, get_peak_rss, reset_peak_rss
+
+
+class StageProfiler:
+    def __init__(self):
+        self.stages: dict[str, dict[str, Any]] = {}
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    @contextmanager
+    def stage(self, name: str, records: int | None = None, bytes_count: int | None = None) -> Iterator[dict]:
+        # records и bytes можно дописать в stage внутри блока, если они известны только по ходу этапа
+        stage = {"records": records, "bytes": bytes_count}
+        # если сбросить пик не удалось, peak_rss_bytes - пик всего процесса, а не этапа
+        stage["peak_rss_scope"] = "stage" if reset_peak_rss() else "process"
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield stage
+        finally:
+            stage["wall_time"] = time.perf_counter() - wall_start
+            stage["cpu_time"] = time.process_time() - cpu_start
+            stage["peak_rss_bytes"] = get_peak_rss()
+            self.stages[name] = stage
+
+    def measure(self, name: str, func: Callable, *args, records: int | None = None, **kwargs):
+        with self.stage(name, records=records):
+            return func(*args, **kwargs)
+
+    def report(self) -> dict[str, Any]:
+        stages = {}
+        for name, stage in self.stages.items():
+            wall_time = stage["wall_time"]
+            stages[name] = {
+                "wall_time": wall_time,
+                "cpu_time": stage["cpu_time"],
+                "records": stage["records"],
+                "records_per_sec": stage["records"] / wall_time if stage["records"] and wall_time else None,
+                "bytes": stage["bytes"],
+                "bytes_per_sec": stage["bytes"] / wall_time if stage["bytes"] and wall_time else None,
+                "peak_rss_bytes": stage["peak_rss_bytes"],
+                "peak_rss_scope": stage["peak_rss_scope"],
+            }
+        return {
+            "wall_time": time.perf_counter() - self._wall_start,
+            "cpu_time": time.process_time() - self._cpu_start,
+            "stages": stages,
+        }
+
+    def show_summary(self, report: dict[str, Any] | None = None):
+        report = report or self.report()
+        show_to_user(f"\n{'Этап':<40}{'Время, с':>10}{'CPU, с':>10}{'Записей/с':>12}{'МБ/с':>10}{'Пик RSS, МБ':>13}")
+        for name, stage in report["stages"].items():
+            show_to_user(
+                f"{name:<40}{stage['wall_time']:>10.3f}{stage['cpu_time']:>10.3f}"
+                f"{_format_number(stage['records_per_sec'], 1):>12}"
+                f"{_format_number(stage['bytes_per_sec'], 2 ** 20):>10}"
+                f"{_format_number(stage['peak_rss_bytes'], 2 ** 20):>13}"
+            )
+        show_to_user(f"{'Всего':<40}{report['wall_time']:>10.3f}{report['cpu_time']:>10.3f}")
+        if any(stage["peak_rss_scope"] == "process" for stage in report["stages"].values()):
+            show_to_user("Пик RSS не удалось сбросить между этапами, указан пик всего процесса")
+
+
+def _format_number(value: float | None, divider: int) -> str:
+    return "-" if value is None else f"{value / divider:.1f}"
+
+
+class ProgressLine:
+    def __init__(self, title: str, total_bytes: int, interval: float = 0.5):
+        self.title = title
+        self.total_bytes = total_bytes
+        self.interval = interval
+        self._start = time.perf_counter()
+        self._last_shown = 0.
+
+    def update(self, done_bytes: int):
+        now = time.perf_counter()
+        if now - self._last_shown < self.interval or not self.total_bytes:
+            return
+        self._last_shown = now
+        elapsed = now - self._start
+        percent = done_bytes / self.total_bytes * 100
+        speed = done_bytes / elapsed if elapsed else 0
+        eta = (self.total_bytes - done_bytes) / speed if speed else 0
+        show_progress(
+            f"{self.title}: {percent:5.1f}% {speed / 2 ** 20:.1f} МБ/с, "
+            f"осталось ~{int(eta) // 60:02d}:{int(eta) % 60:02d}"
+        )
+
+    def finish(self):
+        elapsed = time.perf_counter() - self._start
+        show_progress(f"{self.title}: 100.0% за {elapsed:.1f} с\n")
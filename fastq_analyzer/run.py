@@ -1,144 +1,128 @@
+import cProfile
+import json
+import pstats
 import sys
 
-import altair as alt
 import pandas as pd
 
+from charts import build_charts, build_subplot, warmup_renderer
 from config import Config
 from helpers import FastQFileReader, QualityScoreHelper, AdapterCutter, FastQFileWriter
+from profiler import StageProfiler, ProgressLine
 from utils import show_to_user
 
 
 def run(config: Config):
+    profiler = StageProfiler()
+    if config.cprofile:
+        c_profile = cProfile.Profile()
+        c_profile.runcall(process, config, profiler)
+        pstats_path = config.output_dir / "profile.pstats"
+        c_profile.dump_stats(pstats_path)
+        pstats.Stats(c_profile).sort_stats("cumulative").print_stats(20)
+        show_to_user(f"\nРезультаты cProfile сохранены:\n{pstats_path.absolute().as_uri()}")
+    else:
+        process(config, profiler)
+
+    if config.profile:
+        report = profiler.report()
+        profiler.show_summary(report)
+        report_path = config.output_dir / "profile.json"
+        report_path.write_text(json.dumps(
+            {"datafile": str(config.datafile), **report},
+            ensure_ascii=False, indent=2,
+        ))
+        show_to_user(f"\nОтчет о времени выполнения сохранен:\n{report_path.absolute().as_uri()}")
+
+
+def process(config: Config, profiler: StageProfiler):
 
     result_data = {"Имя файла": config.datafile.name}
 
     quality_helper = QualityScoreHelper(config.quality_type)
-    with open(config.datafile) as f:
+    file_size = config.datafile.stat().st_size
+    with open(config.datafile) as f, profiler.stage("parse", bytes_count=file_size) as stage:
         reader = FastQFileReader(
             stream=f,
             quality_helper=quality_helper,
         )
-        records = reader.get_all_records()
+        progress = ProgressLine("Чтение файла", file_size)
+        records = reader.get_all_records(on_progress=progress.update)
+        progress.finish()
+        stage["records"] = records.count
 
     if config.remove_adapters:
-        records = records.cut(
+        records = profiler.measure(
+            "cut", records.cut,
             adapter_cutter=AdapterCutter(
                 start_adapter=config.start_adapter,
                 end_adapter=config.end_adapter,
                 min_len=config.adapter_min_length,
-            )
+            ),
+            records=records.count,
         )
 
-        result_data["Количество записей с адаптерами"] = records.get_cut_records_count()
-        result_data["Удалено адаптеров"] = records.get_cuts_count()
+        result_data["Количество записей с адаптерами"] = profiler.measure(
+            "get_cut_records_count", records.get_cut_records_count, records=records.count,
+        )
+        result_data["Удалено адаптеров"] = profiler.measure(
+            "get_cuts_count", records.get_cuts_count, records=records.count,
+        )
 
         fastq_filepath = config.output_dir / "cut_result.fastq"
-        with open(fastq_filepath, "w", encoding="utf-8") as f_out:
+        with open(fastq_filepath, "w", encoding="utf-8") as f_out, \
+                profiler.stage("write", records=records.count) as stage:
             FastQFileWriter(f_out, quality_helper).write(records.records)
+            stage["bytes"] = f_out.tell()
         show_to_user(f"\nСобран новый файл с удаленными адаптерами.\n{fastq_filepath.absolute().as_uri()}")
 
     result_data["Количество записей"] = records.count
-    result_data["Самая часто встречающаяся длина последовательности"] = records.get_seq_len_moda()
-    result_data["Средний GC в составе (%)"] = round(records.get_agv_cg_composition(), 2)
+    result_data["Самая часто встречающаяся длина последовательности"] = profiler.measure(
+        "get_seq_len_moda", records.get_seq_len_moda, records=records.count,
+    )
+    result_data["Средний GC в составе (%)"] = round(profiler.measure(
+        "get_agv_cg_composition", records.get_agv_cg_composition, records=records.count,
+    ), 2)
 
-    comp = records.get_avg_nucleotide_composition()
+    comp = profiler.measure(
+        "get_avg_nucleotide_composition", records.get_avg_nucleotide_composition, records=records.count,
+    )
     result_data["Ср. сод. A (%)"] = round(comp["A"], 2)
     result_data["Ср. сод. T (%)"] = round(comp["T"], 2)
     result_data["Ср. сод. G (%)"] = round(comp["G"], 2)
     result_data["Ср. сод. C (%)"] = round(comp["C"], 2)
 
-    first_chart = (
-        alt
-        .Chart(pd.DataFrame(
-            records.get_distinct_len(full_range=True),
-            columns=["x", "y"]
-        ))
-        .mark_bar(size=5)
-        .encode(
-            x=alt.X("x:Q", title="Sequence length"),
-            y=alt.Y("y:Q", title="Number of sequences"),
-        ).properties(
-            title="Sequence length distribution",
-            width=400, height=300,
-        )
-    )
-
-    second_chart = (
-        alt
-        .Chart(pd.DataFrame(
-            records.get_distinct_gc_percentages(),
-            columns=["x", "y"]
-        ))
-        .mark_bar(size=3)
-        .encode(
-            x=alt.X("x:Q", title="GC - composition (%)").axis(values=list(range(0, 101, 10))),
-            y=alt.Y("y:Q", title="Number of sequences"),
-        ).properties(
-            title="GC - composition distribution",
-            width=400, height=300,
-        )
-    )
-
-    third_chart_df = pd.DataFrame(records.get_sequence_content_across_all_bases())\
-        .melt("x", var_name="Line", value_name="Values")
-    third_chart = (
-        alt
-        .Chart(third_chart_df)
-        .mark_line(interpolate="linear")
-        .encode(
-            x=alt.X("x:Q", title="Position in read").axis(),
-            y=alt.Y("Values:Q", title="Nucleotide (%)",
-                    scale=alt.Scale(domainMax=third_chart_df["Values"].max() + 3)),
-            color=alt.Color("Line:N", sort=("A", "T", "G", "C", "N")),
-        ).properties(
-            title="Sequence content across all bases",
-            width=400, height=300,
-        )
-    )
-
-    fourth_chart = (
-        alt
-        .Chart(pd.DataFrame(
-            records.average_quality_per_read(),
-            columns=["x", "y"]
-        ))
-        .mark_bar(size=3)
-        .encode(
-            x=alt.X("x:Q", title="Mean sequence quality (phred score)").axis(),
-            y=alt.Y("y:Q", title="Number of sequences"),
-        ).properties(
-            title="Average quality per read",
-            width=400, height=300,
-        )
-    )
-
-    fives_chart_df = pd.DataFrame(records.quality_scores_across_all_bases(), columns=["x", "y"])
-    fives_chart = (
-        alt
-        .Chart(fives_chart_df)
-        .mark_line()
-        .encode(
-            x=alt.X("x:Q", title="Position in read"),
-            y=alt.Y("y:Q", title="Quality score",
-                    scale=alt.Scale(domain=[fives_chart_df["y"].min() - 1, fives_chart_df["y"].max() + 1])),
-        ).properties(
-            title="Quality scores across all bases",
-            width=400, height=300,
-        )
-    )
-
-    first_chart.save(config.output_dir / "chart1.png", ppi=config.charts_quality)
-    second_chart.save(config.output_dir / "chart2.png", ppi=config.charts_quality)
-    third_chart.save(config.output_dir / "chart3.png", ppi=config.charts_quality)
-    fourth_chart.save(config.output_dir / "chart4.png", ppi=config.charts_quality)
-    fives_chart.save(config.output_dir / "chart5.png", ppi=config.charts_quality)
+    charts_data = {
+        "distinct_len": profiler.measure(
+            "get_distinct_len", records.get_distinct_len, full_range=True, records=records.count,
+        ),
+        "distinct_gc": profiler.measure(
+            "get_distinct_gc_percentages", records.get_distinct_gc_percentages, records=records.count,
+        ),
+        "content_across_bases": profiler.measure(
+            "get_sequence_content_across_all_bases", records.get_sequence_content_across_all_bases,
+            records=records.count,
+        ),
+        "avg_quality_per_read": profiler.measure(
+            "average_quality_per_read", records.average_quality_per_read, records=records.count,
+        ),
+        "quality_across_bases": profiler.measure(
+            "quality_scores_across_all_bases", records.quality_scores_across_all_bases, records=records.count,
+        ),
+    }
+    charts = profiler.measure("build_charts", build_charts, **charts_data)
+    profiler.measure("init_chart_renderer", warmup_renderer, config.charts_quality)
+    for i, chart in enumerate(charts, start=1):
+        save_path = config.output_dir / f"chart{i}.png"
+        with profiler.stage(f"save_chart{i}") as stage:
+            chart.save(save_path, ppi=config.charts_quality)
+            stage["bytes"] = save_path.stat().st_size
 
     if config.subplot:
         save_path = config.output_dir / "charts.png"
-        alt.vconcat(
-            alt.hconcat(first_chart, second_chart, third_chart),
-            alt.hconcat(fourth_chart, fives_chart),
-        ).save(save_path, ppi=config.charts_quality)
+        with profiler.stage("save_subplot") as stage:
+            build_subplot(charts).save(save_path, ppi=config.charts_quality)
+            stage["bytes"] = save_path.stat().st_size
     show_to_user(f"\nГрафики сохранены в папку:\n{config.output_dir.absolute().as_uri()}")
 
     columns = [
@@ -154,10 +138,13 @@ def run(config: Config):
         "Ср. сод. C (%)",
     ]
     df_path = config.output_dir.parent / "dataframe.csv"
-    pd.DataFrame(
-        [[result_data.get(name) for name in columns]],
-        columns=columns,
-    ).to_csv(df_path, sep=";", mode="a", header=not df_path.exists(), index=False)
+    df_size = df_path.stat().st_size if df_path.exists() else 0
+    with profiler.stage("csv_append", records=1) as stage:
+        pd.DataFrame(
+            [[result_data.get(name) for name in columns]],
+            columns=columns,
+        ).to_csv(df_path, sep=";", mode="a", header=not df_path.exists(), index=False)
+        stage["bytes"] = df_path.stat().st_size - df_size
 
 
 if __name__ == "__main__":
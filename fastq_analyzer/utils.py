@@ -1,7 +1,27 @@
+import sys
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
 def show_to_user(text: str):
     print(text)
 
 
+_progress_width = 0
+
+
+def show_progress(text: str):
+    # перерисовывает текущую строку, для завершения строки передайте текст с \n на конце
+    global _progress_width
+    line = text.rstrip("\n")
+    print(f"\r{line.ljust(_progress_width)}", end="\n" if text.endswith("\n") else "", flush=True)
+    _progress_width = 0 if text.endswith("\n") else len(line)
+
+
 def get_number(text: str, gt: int = None, lt: int = None) -> int:
     try:
         num = int(input(f"{text}: "))
@@ -31,3 +51,30 @@ def yes_no_input(text: str) -> bool:
         return False
     else:
         return yes_no_input(f"Введите корректное значение ({", ".join(_yes_values)}/{", ".join(_no_values)})")
+
+
+_proc_self = Path("/proc/self")
+
+
+def reset_peak_rss() -> bool:
+    # Linux позволяет сбросить пиковое значение RSS процесса (VmHWM), чтобы мерить каждый этап отдельно
+    try:
+        (_proc_self / "clear_refs").write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def get_peak_rss() -> int | None:
+    """Пиковое потребление памяти процессом в байтах"""
+    try:
+        for line in (_proc_self / "status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # на macOS ru_maxrss в байтах, на Linux в килобайтах
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
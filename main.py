@@ -2,7 +2,7 @@ import sys
 from pathlib import Path
 
 if len(sys.argv) < 2:
-    print("Выберите команду для запуска: fastq, geo")
+    print("Выберите команду для запуска: fastq, bench, geo")
 
 match sys.argv[1]:
     case "fastq":
@@ -10,6 +10,11 @@ match sys.argv[1]:
         from fastq_analyzer.run import run
         from fastq_analyzer.config import Config
         run(Config(sys.argv[2:]))
+    case "bench":
+        sys.path.append((Path(__file__).parent / "fastq_analyzer").absolute().as_posix())
+        from fastq_analyzer.benchmark import run
+        from fastq_analyzer.config import BenchmarkConfig
+        run(BenchmarkConfig(sys.argv[2:]))
     case "geo":
         urls = sys.argv[2:]
         if len(urls) == 0: